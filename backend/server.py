@@ -1,6 +1,9 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
@@ -10,6 +13,7 @@ from datetime import datetime, timedelta, timezone
 import re
 import random
 import string
+import hashlib
 
 from models import (
     Admin, AdminLogin, AdminResponse,
@@ -66,6 +70,23 @@ def calculate_expiry_date(expiry_type: str, expiry_value: Optional[int]) -> Opti
     return None
 
 
+def etag_matches(if_none_match: Optional[str], opaque_tag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an opaque tag (RFC 9110)"""
+    if not if_none_match:
+        return False
+    
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return True
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == opaque_tag:
+            return True
+    
+    return False
+
+
 async def check_profile_active(profile: dict) -> bool:
     """Check if profile is active and not expired"""
     if not profile.get('is_active', True):
@@ -350,8 +371,8 @@ async def get_profile_media(profile_id: str, admin_id: str = Depends(get_current
 # ==================== PUBLIC INVITATION ROUTES ====================
 
 @api_router.get("/invite/{slug}", response_model=InvitationPublicView)
-async def get_invitation(slug: str):
-    """Get public invitation by slug"""
+async def get_invitation(slug: str, request: Request):
+    """Get public invitation by slug, answering 304 when If-None-Match matches the ETag"""
     profile = await db.profiles.find_one({"slug": slug}, {"_id": 0})
     
     if not profile:
@@ -385,7 +406,7 @@ async def get_invitation(slug: str):
         if isinstance(greeting.get('created_at'), str):
             greeting['created_at'] = datetime.fromisoformat(greeting['created_at'])
     
-    return InvitationPublicView(
+    invitation = InvitationPublicView(
         slug=profile['slug'],
         groom_name=profile['groom_name'],
         bride_name=profile['bride_name'],
@@ -403,6 +424,18 @@ async def get_invitation(slug: str):
         media=[ProfileMedia(**m) for m in media_list],
         greetings=[GreetingResponse(**g) for g in greetings_list]
     )
+    
+    # ETag over the rendered body lets repeat viewers revalidate without a download.
+    # Weak, because GZipMiddleware may send the same tag on gzip and identity bodies.
+    response = JSONResponse(content=jsonable_encoder(invitation))
+    opaque_tag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    etag = f'W/{opaque_tag}'
+    
+    if etag_matches(request.headers.get('if-none-match'), opaque_tag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    return response
 
 
 @api_router.post("/invite/{slug}/greetings", response_model=GreetingResponse)
@@ -574,6 +607,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (public invitations with media and greetings)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -5,7 +5,11 @@ Testing all features mentioned in the review request
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import sys
 import os
@@ -15,23 +19,57 @@ BACKEND_URL = "https://dream-wedding-13.preview.emergentagent.com/api"
 ADMIN_EMAIL = "admin@wedding.com"
 ADMIN_PASSWORD = "admin123"
 
+def create_session():
+    """Create a session with a larger connection pool and retries on transient 5xx"""
+    session = requests.Session()
+    # POST is not retried so a gateway error cannot create duplicate profiles
+    retry = Retry(
+        total=3,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"])
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 class WeddingPlatformTester:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
+        self.public_session = create_session()  # Never carries auth headers
         self.admin_token = None
         self.test_profiles = []
         self.test_results = []
+        self.test_order = []
+        self.profile_sources = {}  # profile id -> name of the test that created it
+        self._local = threading.local()  # Per-thread output buffer for concurrent tests
+        self._print_lock = threading.Lock()
+        
+    def emit(self, text):
+        """Print directly, or buffer while running inside run_test"""
+        lines = getattr(self._local, "lines", None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+    
+    def add_profile(self, profile):
+        """Record a created profile along with the test that created it"""
+        self.profile_sources[profile["id"]] = getattr(self._local, "test_name", None)
+        self.test_profiles.append(profile)
         
     def log_test(self, test_name, success, details=""):
         """Log test result"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
+        self.emit(f"{status}: {test_name}")
         if details:
-            print(f"   Details: {details}")
+            self.emit(f"   Details: {details}")
         self.test_results.append({
             "test": test_name,
             "success": success,
-            "details": details
+            "details": details,
+            "source": getattr(self._local, "test_name", None)
         })
         
     def authenticate_admin(self):
@@ -62,7 +100,7 @@ class WeddingPlatformTester:
     
     def test_profile_creation_and_slug_generation(self):
         """Test 1: Profile Creation & Slug Generation"""
-        print("\n📝 TESTING PROFILE CREATION & SLUG GENERATION...")
+        self.emit("\n📝 TESTING PROFILE CREATION & SLUG GENERATION...")
         
         # Test with specific names from review request
         profile_data = {
@@ -126,7 +164,7 @@ class WeddingPlatformTester:
                 else:
                     self.log_test("Invitation Link Format", False, f"Expected: {expected_link}, Got: {profile.get('invitation_link')}")
                 
-                self.test_profiles.append(profile)
+                self.add_profile(profile)
                 return True
                 
             else:
@@ -139,7 +177,7 @@ class WeddingPlatformTester:
     
     def test_profile_isolation(self):
         """Test 2: Profile Isolation"""
-        print("\n🔒 TESTING PROFILE ISOLATION...")
+        self.emit("\n🔒 TESTING PROFILE ISOLATION...")
         
         # Create second profile with similar names
         profile_data_2 = {
@@ -186,7 +224,7 @@ class WeddingPlatformTester:
                 else:
                     self.log_test("Profile Data Isolation", True, f"Expected overlap in test data: {overlap_fields}")
                 
-                self.test_profiles.append(profile_2)
+                self.add_profile(profile_2)
                 return True
                 
             else:
@@ -199,20 +237,18 @@ class WeddingPlatformTester:
     
     def test_public_invitation_api(self):
         """Test 3: Public Invitation API (No Auth)"""
-        print("\n🌐 TESTING PUBLIC INVITATION API...")
+        self.emit("\n🌐 TESTING PUBLIC INVITATION API...")
         
         if not self.test_profiles:
             self.log_test("Public API Test", False, "No test profiles available")
             return False
         
         # Test without authentication
-        public_session = requests.Session()  # New session without auth headers
-        
         for i, profile in enumerate(self.test_profiles):
             slug = profile["slug"]
             
             try:
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 
                 if response.status_code == 200:
                     invitation_data = response.json()
@@ -246,7 +282,7 @@ class WeddingPlatformTester:
         
         # Test with invalid slug
         try:
-            response = public_session.get(f"{BACKEND_URL}/invite/invalid-slug-12345")
+            response = self.public_session.get(f"{BACKEND_URL}/invite/invalid-slug-12345")
             if response.status_code == 404:
                 self.log_test("Invalid Slug Handling", True, "Returns 404 for invalid slug")
             else:
@@ -258,7 +294,7 @@ class WeddingPlatformTester:
     
     def test_expiry_logic(self):
         """Test 4: Expiry Logic"""
-        print("\n⏰ TESTING EXPIRY LOGIC...")
+        self.emit("\n⏰ TESTING EXPIRY LOGIC...")
         
         # Test default expiry (30 days)
         profile_default = {
@@ -285,16 +321,15 @@ class WeddingPlatformTester:
                     self.log_test("Default Expiry Value", False, f"Expected 30, got {profile.get('link_expiry_value')}")
                 
                 # Verify link is immediately accessible
-                public_session = requests.Session()
                 slug = profile["slug"]
                 
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 if response.status_code == 200:
                     self.log_test("Immediate Link Access", True, "New profile accessible immediately")
                 else:
                     self.log_test("Immediate Link Access", False, f"Status: {response.status_code}")
                 
-                self.test_profiles.append(profile)
+                self.add_profile(profile)
                 
         except Exception as e:
             self.log_test("Default Expiry Test", False, f"Exception: {str(e)}")
@@ -330,7 +365,7 @@ class WeddingPlatformTester:
                 else:
                     self.log_test("Expiry Date Calculation", False, "No expiry date calculated")
                 
-                self.test_profiles.append(profile)
+                self.add_profile(profile)
                 
         except Exception as e:
             self.log_test("Custom Expiry Test", False, f"Exception: {str(e)}")
@@ -339,7 +374,7 @@ class WeddingPlatformTester:
     
     def test_admin_panel_apis(self):
         """Test 5: Admin Panel APIs"""
-        print("\n👨‍💼 TESTING ADMIN PANEL APIs...")
+        self.emit("\n👨‍💼 TESTING ADMIN PANEL APIs...")
         
         if not self.test_profiles:
             self.log_test("Admin Panel Test", False, "No test profiles available")
@@ -403,7 +438,7 @@ class WeddingPlatformTester:
     
     def test_whatsapp_integration(self):
         """Test 6: WhatsApp Integration"""
-        print("\n📱 TESTING WHATSAPP INTEGRATION...")
+        self.emit("\n📱 TESTING WHATSAPP INTEGRATION...")
         
         # Test valid WhatsApp numbers
         valid_profile = {
@@ -432,10 +467,9 @@ class WeddingPlatformTester:
                     self.log_test("Valid WhatsApp Numbers", False, "WhatsApp numbers not stored properly")
                 
                 # Verify numbers appear in public API
-                public_session = requests.Session()
                 slug = profile["slug"]
                 
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 if response.status_code == 200:
                     public_data = response.json()
                     
@@ -445,7 +479,7 @@ class WeddingPlatformTester:
                     else:
                         self.log_test("WhatsApp in Public API", False, "Numbers missing in public API")
                 
-                self.test_profiles.append(profile)
+                self.add_profile(profile)
                 
         except Exception as e:
             self.log_test("Valid WhatsApp Test", False, f"Exception: {str(e)}")
@@ -478,7 +512,7 @@ class WeddingPlatformTester:
     
     def test_multi_language_support(self):
         """Test 7: Multi-Language Support"""
-        print("\n🌍 TESTING MULTI-LANGUAGE SUPPORT...")
+        self.emit("\n🌍 TESTING MULTI-LANGUAGE SUPPORT...")
         
         # Test profile with multiple languages
         multilang_profile = {
@@ -523,10 +557,9 @@ class WeddingPlatformTester:
                     self.log_test("Custom Text Storage", False, "Custom text not stored")
                 
                 # Verify public API returns all languages
-                public_session = requests.Session()
                 slug = profile["slug"]
                 
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 if response.status_code == 200:
                     public_data = response.json()
                     
@@ -535,7 +568,7 @@ class WeddingPlatformTester:
                     else:
                         self.log_test("Multi-Language in Public API", False, f"Languages mismatch in public API")
                 
-                self.test_profiles.append(profile)
+                self.add_profile(profile)
                 
         except Exception as e:
             self.log_test("Multi-Language Test", False, f"Exception: {str(e)}")
@@ -544,7 +577,7 @@ class WeddingPlatformTester:
     
     def test_design_system(self):
         """Test 8: Design System"""
-        print("\n🎨 TESTING DESIGN SYSTEM...")
+        self.emit("\n🎨 TESTING DESIGN SYSTEM...")
         
         # Test all 5 design IDs mentioned in review request
         design_ids = ["royal_classic", "floral_soft", "divine_temple", "modern_minimal", "cinematic_luxury"]
@@ -571,10 +604,9 @@ class WeddingPlatformTester:
                         self.log_test(f"Design ID: {design_id}", True, f"Design stored correctly")
                         
                         # Verify design appears in public API
-                        public_session = requests.Session()
                         slug = profile["slug"]
                         
-                        response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                        response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                         if response.status_code == 200:
                             public_data = response.json()
                             
@@ -623,7 +655,7 @@ class WeddingPlatformTester:
     
     def test_guest_greetings(self):
         """Test 9: Guest Greetings"""
-        print("\n💌 TESTING GUEST GREETINGS...")
+        self.emit("\n💌 TESTING GUEST GREETINGS...")
         
         if not self.test_profiles:
             self.log_test("Guest Greetings Test", False, "No test profiles available")
@@ -634,15 +666,13 @@ class WeddingPlatformTester:
         slug = profile["slug"]
         
         # Test greeting submission (no auth required)
-        public_session = requests.Session()
-        
         greeting_data = {
             "guest_name": "Rohit Sharma",
             "message": "Congratulations on your wedding! Wishing you both a lifetime of happiness and love. May your journey together be filled with joy and prosperity."
         }
         
         try:
-            response = public_session.post(f"{BACKEND_URL}/invite/{slug}/greetings", json=greeting_data)
+            response = self.public_session.post(f"{BACKEND_URL}/invite/{slug}/greetings", json=greeting_data)
             
             if response.status_code == 200:
                 greeting_response = response.json()
@@ -654,7 +684,7 @@ class WeddingPlatformTester:
                     self.log_test("Guest Greeting Submission", False, "Greeting data mismatch")
                 
                 # Verify greeting appears in public invitation API
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 if response.status_code == 200:
                     invitation_data = response.json()
                     
@@ -672,7 +702,7 @@ class WeddingPlatformTester:
         
         # Test greeting with invalid slug
         try:
-            response = public_session.post(f"{BACKEND_URL}/invite/invalid-slug/greetings", json=greeting_data)
+            response = self.public_session.post(f"{BACKEND_URL}/invite/invalid-slug/greetings", json=greeting_data)
             
             if response.status_code == 404:
                 self.log_test("Greeting Invalid Slug", True, "Returns 404 for invalid slug")
@@ -684,39 +714,66 @@ class WeddingPlatformTester:
         
         return True
     
+    def run_test(self, test):
+        """Run a single test, printing its output as one block once it finishes"""
+        self._local.test_name = test.__name__
+        self._local.lines = []
+        try:
+            test()
+        except Exception as e:
+            self.emit(f"❌ TEST FAILED WITH EXCEPTION: {str(e)}")
+        finally:
+            lines = self._local.lines
+            self._local.lines = None
+            self._local.test_name = None
+            with self._print_lock:
+                print("\n".join(lines))
+    
     def run_all_tests(self):
         """Run all tests"""
         print("🚀 STARTING COMPREHENSIVE BACKEND TESTING")
         print("=" * 60)
         
-        # Authenticate first
-        if not self.authenticate_admin():
-            print("❌ AUTHENTICATION FAILED - STOPPING TESTS")
-            return False
-        
-        # Run all tests
-        tests = [
-            self.test_profile_creation_and_slug_generation,
-            self.test_profile_isolation,
-            self.test_public_invitation_api,
-            self.test_expiry_logic,
-            self.test_admin_panel_apis,
-            self.test_whatsapp_integration,
-            self.test_multi_language_support,
-            self.test_design_system,
-            self.test_guest_greetings
-        ]
-        
-        for test in tests:
-            try:
-                test()
-            except Exception as e:
-                print(f"❌ TEST FAILED WITH EXCEPTION: {str(e)}")
-        
-        # Print summary
-        self.print_summary()
-        
-        return True
+        try:
+            # Authenticate first
+            if not self.authenticate_admin():
+                print("❌ AUTHENTICATION FAILED - STOPPING TESTS")
+                return False
+            
+            # Stage 1: later tests depend on the profiles created here
+            sequential_tests = [
+                self.test_profile_creation_and_slug_generation,
+                self.test_profile_isolation,
+                self.test_public_invitation_api
+            ]
+            
+            # Stage 2: independent of each other, run concurrently on the pooled sessions
+            concurrent_tests = [
+                self.test_expiry_logic,
+                self.test_admin_panel_apis,
+                self.test_whatsapp_integration,
+                self.test_multi_language_support,
+                self.test_design_system,
+                self.test_guest_greetings
+            ]
+            
+            # Summary lists follow this order regardless of which thread finished first
+            self.test_order = [test.__name__ for test in sequential_tests + concurrent_tests]
+            
+            for test in sequential_tests:
+                self.run_test(test)
+            
+            with ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor:
+                list(executor.map(self.run_test, concurrent_tests))
+            
+            # Print summary
+            self.print_summary()
+            
+            return True
+        finally:
+            # Release pooled connections
+            self.session.close()
+            self.public_session.close()
     
     def print_summary(self):
         """Print test summary"""
@@ -732,15 +789,20 @@ class WeddingPlatformTester:
         print(f"Failed: {total - passed}")
         print(f"Success Rate: {(passed/total)*100:.1f}%")
         
+        # sorted() is stable, so entries from the same test keep their original order
+        rank = {name: i for i, name in enumerate(self.test_order)}
+        
         if total - passed > 0:
             print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
+            for result in sorted(self.test_results, key=lambda r: rank.get(r["source"], -1)):
                 if not result["success"]:
                     print(f"   • {result['test']}: {result['details']}")
         
-        print(f"\n📝 CREATED {len(self.test_profiles)} TEST PROFILES")
-        for i, profile in enumerate(self.test_profiles):
-            print(f"   {i+1}. {profile['groom_name']} & {profile['bride_name']} - /invite/{profile['slug']}")
+        profiles = sorted(self.test_profiles, key=lambda p: rank.get(self.profile_sources.get(p["id"]), -1))
+        print(f"\n📝 CREATED {len(profiles)} TEST PROFILES")
+        for i, profile in enumerate(profiles):
+            source = self.profile_sources.get(profile["id"]) or "unknown"
+            print(f"   {i+1}. {profile['groom_name']} & {profile['bride_name']} - /invite/{profile['slug']} ({source})")
 
 
 if __name__ == "__main__":
@@ -4,11 +4,11 @@ PHASE 3 - Deity Background Layer Backend Testing
 Testing deity_id field CRUD operations as per review request
 """
 
-import requests
 import json
 from datetime import datetime, timedelta
 import sys
 import os
+from backend_test import create_session
 
 # Configuration
 BACKEND_URL = "https://dream-wedding-13.preview.emergentagent.com/api"
@@ -17,7 +17,8 @@ ADMIN_PASSWORD = "admin123"
 
 class DeityBackgroundTester:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
+        self.public_session = create_session()  # Never carries auth headers
         self.admin_token = None
         self.test_profiles = []
         self.test_results = []
@@ -543,14 +544,12 @@ class DeityBackgroundTester:
             return False
         
         # Test without authentication
-        public_session = requests.Session()
-        
         # Test with multiple profiles to verify different deity_id values
         for i, profile in enumerate(self.test_profiles[:3]):  # Test first 3 profiles
             slug = profile["slug"]
             
             try:
-                response = public_session.get(f"{BACKEND_URL}/invite/{slug}")
+                response = self.public_session.get(f"{BACKEND_URL}/invite/{slug}")
                 
                 if response.status_code == 200:
                     invitation_data = response.json()
@@ -650,42 +649,47 @@ class DeityBackgroundTester:
     
     def run_all_deity_tests(self):
         """Run all deity_id field tests"""
-        print("🕉️ STARTING PHASE 3 - DEITY BACKGROUND LAYER BACKEND TESTING")
-        print("=" * 70)
-        print("Testing deity_id field CRUD operations as per review request")
-        print("=" * 70)
-        
-        # Authenticate first
-        if not self.authenticate_admin():
-            print("❌ AUTHENTICATION FAILED - STOPPING TESTS")
-            return False
-        
-        # Run all deity tests in sequence
-        tests = [
-            self.test_profile_creation_without_deity_id,
-            self.test_profile_creation_with_ganesha,
-            self.test_profile_creation_with_venkateswara_padmavati,
-            self.test_profile_creation_with_shiva_parvati,
-            self.test_profile_creation_with_lakshmi_vishnu,
-            self.test_profile_creation_with_none,
-            self.test_profile_update_null_to_ganesha,
-            self.test_profile_update_ganesha_to_null,
-            self.test_get_profile_by_id_includes_deity_id,
-            self.test_get_all_profiles_includes_deity_id,
-            self.test_public_invitation_api_includes_deity_id,
-            self.test_invalid_deity_id_rejection
-        ]
-        
-        for test in tests:
-            try:
-                test()
-            except Exception as e:
-                print(f"❌ TEST FAILED WITH EXCEPTION: {str(e)}")
-        
-        # Print summary
-        self.print_summary()
-        
-        return True
+        try:
+            print("🕉️ STARTING PHASE 3 - DEITY BACKGROUND LAYER BACKEND TESTING")
+            print("=" * 70)
+            print("Testing deity_id field CRUD operations as per review request")
+            print("=" * 70)
+            
+            # Authenticate first
+            if not self.authenticate_admin():
+                print("❌ AUTHENTICATION FAILED - STOPPING TESTS")
+                return False
+            
+            # Run all deity tests in sequence
+            tests = [
+                self.test_profile_creation_without_deity_id,
+                self.test_profile_creation_with_ganesha,
+                self.test_profile_creation_with_venkateswara_padmavati,
+                self.test_profile_creation_with_shiva_parvati,
+                self.test_profile_creation_with_lakshmi_vishnu,
+                self.test_profile_creation_with_none,
+                self.test_profile_update_null_to_ganesha,
+                self.test_profile_update_ganesha_to_null,
+                self.test_get_profile_by_id_includes_deity_id,
+                self.test_get_all_profiles_includes_deity_id,
+                self.test_public_invitation_api_includes_deity_id,
+                self.test_invalid_deity_id_rejection
+            ]
+            
+            for test in tests:
+                try:
+                    test()
+                except Exception as e:
+                    print(f"❌ TEST FAILED WITH EXCEPTION: {str(e)}")
+            
+            # Print summary
+            self.print_summary()
+            
+            return True
+        finally:
+            # Release pooled connections
+            self.session.close()
+            self.public_session.close()
     
     def print_summary(self):
         """Print test summary"""
@@ -4,11 +4,11 @@ Specific Design System Tests as requested in the review
 Testing the exact scenarios mentioned in the review request
 """
 
-import requests
 import json
 from datetime import datetime, timedelta, timezone
 import os
 from dotenv import load_dotenv
+from backend_test import create_session
 
 # Load environment variables
 load_dotenv('/app/frontend/.env')
@@ -21,7 +21,8 @@ print(f"🔗 Testing backend at: {API_BASE}")
 
 class DesignSystemSpecificTester:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
+        self.public_session = create_session()  # Never carries auth headers
         self.admin_token = None
         self.test_profiles = []  # Store test profile data
         
@@ -303,9 +304,7 @@ class DesignSystemSpecificTester:
         
         for profile in self.test_profiles:
             try:
-                # Use new session without auth for public access
-                public_session = requests.Session()
-                response = public_session.get(f"{API_BASE}/invite/{profile['slug']}")
+                response = self.public_session.get(f"{API_BASE}/invite/{profile['slug']}")
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -382,40 +381,45 @@ class DesignSystemSpecificTester:
     
     def run_all_tests(self):
         """Run all specific tests as mentioned in review request"""
-        print("🚀 Starting SPECIFIC Design System Tests as per Review Request")
-        print("=" * 80)
-        
-        # Login first
-        if not self.login_admin():
-            print("❌ Cannot proceed without authentication")
-            return False
-        
-        test_results = []
-        
-        # Run all specific tests
-        test_results.append(self.test_1_create_profile_without_design_id())
-        test_results.append(self.test_2_create_profile_with_royal_classic())
-        test_results.append(self.test_3_create_profile_with_floral_soft())
-        test_results.append(self.test_4_update_profile_design())
-        test_results.append(self.test_5_get_profile_by_id())
-        test_results.append(self.test_6_get_public_invitation())
-        test_results.append(self.test_7_create_all_8_designs())
-        
-        # Summary
-        passed = sum(test_results)
-        total = len(test_results)
-        
-        print("\n" + "=" * 80)
-        print(f"🏁 SPECIFIC DESIGN SYSTEM TEST SUMMARY: {passed}/{total} tests passed")
-        
-        if passed == total:
-            print("🎉 ALL SPECIFIC DESIGN SYSTEM TESTS PASSED!")
-            print("✅ Design system backend integration working correctly")
-            return True
-        else:
-            failed = total - passed
-            print(f"⚠️  {failed} specific tests failed")
-            return False
+        try:
+            print("🚀 Starting SPECIFIC Design System Tests as per Review Request")
+            print("=" * 80)
+            
+            # Login first
+            if not self.login_admin():
+                print("❌ Cannot proceed without authentication")
+                return False
+            
+            test_results = []
+            
+            # Run all specific tests
+            test_results.append(self.test_1_create_profile_without_design_id())
+            test_results.append(self.test_2_create_profile_with_royal_classic())
+            test_results.append(self.test_3_create_profile_with_floral_soft())
+            test_results.append(self.test_4_update_profile_design())
+            test_results.append(self.test_5_get_profile_by_id())
+            test_results.append(self.test_6_get_public_invitation())
+            test_results.append(self.test_7_create_all_8_designs())
+            
+            # Summary
+            passed = sum(test_results)
+            total = len(test_results)
+            
+            print("\n" + "=" * 80)
+            print(f"🏁 SPECIFIC DESIGN SYSTEM TEST SUMMARY: {passed}/{total} tests passed")
+            
+            if passed == total:
+                print("🎉 ALL SPECIFIC DESIGN SYSTEM TESTS PASSED!")
+                print("✅ Design system backend integration working correctly")
+                return True
+            else:
+                failed = total - passed
+                print(f"⚠️  {failed} specific tests failed")
+                return False
+        finally:
+            # Release pooled connections
+            self.session.close()
+            self.public_session.close()
 
 def main():
     """Main test execution"""
@@ -0,0 +1,429 @@
+"""
+Pytest suite for the Wedding Invitation Platform backend API
+Run in parallel with: pytest tests/test_backend.py -n auto --dist loadgroup
+"""
+
+import base64
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+from backend_test import ADMIN_EMAIL, ADMIN_PASSWORD, BACKEND_URL, create_session
+
+API_BASE = BACKEND_URL
+
+TOKEN_CACHE_FILE = os.path.join(tempfile.gettempdir(), ".wedding_admin_token.json")
+TOKEN_EXPIRY_MARGIN = 60  # seconds
+
+MEDIA_SEED_COUNT = 24
+MEDIA_SEED_WORKERS = 16  # Stays below the adapter's pool_maxsize of 32
+
+DESIGN_IDS = ["royal_classic", "floral_soft", "divine_temple", "modern_minimal", "cinematic_luxury"]
+
+# Endpoints
+LOGIN_URL = f"{API_BASE}/auth/login"
+ME_URL = f"{API_BASE}/auth/me"
+PROFILES_URL = f"{API_BASE}/admin/profiles"
+INVALID_INVITE_URL = f"{API_BASE}/invite/invalid-slug-12345"
+INVALID_GREETINGS_URL = f"{API_BASE}/invite/invalid-slug/greetings"
+
+# Static payloads, built once at import time
+LOGIN_PAYLOAD = {"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+INVALID_LOGIN_PAYLOAD = {"email": ADMIN_EMAIL, "password": "wrong-password"}
+
+_EVENT_DATE_ISO = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+
+PROFILE_PAYLOAD_TEMPLATE = {
+    "event_type": "marriage",
+    "venue": "Grand Palace Hotel, Mumbai",
+    "language": ["english"],
+    "design_id": "royal_classic",
+    "deity_id": "ganesha",
+    "whatsapp_groom": "+919876543210",
+    "whatsapp_bride": "+918765432109",
+    "enabled_languages": ["english", "hindi"],
+    "link_expiry_type": "days",
+    "link_expiry_value": 30
+}
+
+MEDIA_PAYLOAD = {
+    "media_type": "photo",
+    "media_url": "https://images.unsplash.com/photo-1519741497674-611481863552",
+    "caption": "Engagement photo",
+    "order": 1
+}
+
+UPDATE_PAYLOAD = {
+    "venue": "Updated Venue - Grand Ballroom",
+    "design_id": "cinematic_luxury"
+}
+
+GREETING_PAYLOAD = {
+    "guest_name": "Rohit Sharma",
+    "message": "Congratulations on your wedding! Wishing you both a lifetime of happiness."
+}
+
+# Request bodies serialized with orjson, sent via post_json/put_json
+JSON_HEADERS = {"Content-Type": "application/json"}
+LOGIN_BODY = orjson.dumps(LOGIN_PAYLOAD)
+INVALID_LOGIN_BODY = orjson.dumps(INVALID_LOGIN_PAYLOAD)
+MEDIA_BODY = orjson.dumps(MEDIA_PAYLOAD)
+UPDATE_BODY = orjson.dumps(UPDATE_PAYLOAD)
+GREETING_BODY = orjson.dumps(GREETING_PAYLOAD)
+MEDIA_SEED_BODIES = [
+    orjson.dumps({**MEDIA_PAYLOAD, "caption": f"Gallery photo {order}", "order": order})
+    for order in range(MEDIA_SEED_COUNT)
+]
+
+
+def profile_url(profile_id):
+    """Admin URL for a single profile"""
+    return f"{PROFILES_URL}/{profile_id}"
+
+
+def invite_url(slug):
+    """Public invitation URL for a slug"""
+    return f"{API_BASE}/invite/{slug}"
+
+
+def build_profile_payload(groom_name, bride_name, **overrides):
+    """Shallow-copy the profile template with an event date 30 days out"""
+    return {
+        **PROFILE_PAYLOAD_TEMPLATE,
+        "groom_name": groom_name,
+        "bride_name": bride_name,
+        "event_date": _EVENT_DATE_ISO,
+        **overrides
+    }
+
+
+def post_json(session, url, body):
+    """POST a pre-serialized JSON body"""
+    return session.post(url, data=body, headers=JSON_HEADERS)
+
+
+def put_json(session, url, body):
+    """PUT a pre-serialized JSON body"""
+    return session.put(url, data=body, headers=JSON_HEADERS)
+
+
+def get_token_expiry(token):
+    """Read the exp claim from a JWT without verifying its signature"""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))["exp"]
+
+
+def load_cached_token():
+    """Return the cached admin token if it is valid for at least TOKEN_EXPIRY_MARGIN"""
+    try:
+        with open(TOKEN_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("api_base") != API_BASE or cached.get("exp", 0) <= time.time() + TOKEN_EXPIRY_MARGIN:
+        return None
+    return cached.get("token")
+
+
+def clear_cached_token():
+    """Remove the cached token file, ignoring a file another worker already removed"""
+    try:
+        os.remove(TOKEN_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+
+
+def save_cached_token(token):
+    """Write the token atomically so parallel workers never read a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(TOKEN_CACHE_FILE))
+    with os.fdopen(fd, "w") as f:
+        json.dump({"api_base": API_BASE, "token": token, "exp": get_token_expiry(token)}, f)
+    os.replace(tmp_path, TOKEN_CACHE_FILE)
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="session")
+def admin_token():
+    """Admin JWT cached on disk, only logging in again once it is about to expire or is rejected"""
+    session = create_session()
+    try:
+        token = load_cached_token()
+        if token:
+            # A rotated JWT_SECRET_KEY gives 401; a reseeded admin gives 404 from /auth/me
+            response = session.get(ME_URL, headers={"Authorization": f"Bearer {token}"})
+            if response.status_code not in (401, 404):
+                response.raise_for_status()
+                return token
+            clear_cached_token()
+
+        response = post_json(session, LOGIN_URL, LOGIN_BODY)
+    finally:
+        session.close()
+    response.raise_for_status()
+    token = orjson.loads(response.content)["access_token"]
+    save_cached_token(token)
+    return token
+
+
+@pytest.fixture(scope="session")
+def admin_session(admin_token):
+    """Session authenticated as admin"""
+    session = create_session()
+    session.headers.update({"Authorization": f"Bearer {admin_token}"})
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def public_session():
+    """Session without auth headers for public endpoints"""
+    session = create_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def created_profile(admin_session):
+    """Profile shared by read-only tests, yields (profile_id, slug)"""
+    payload = build_profile_payload("Rajesh Kumar", "Priya Sharma")
+    response = post_json(admin_session, PROFILES_URL, orjson.dumps(payload))
+    response.raise_for_status()
+    profile = orjson.loads(response.content)
+    yield profile["id"], profile["slug"]
+    admin_session.delete(profile_url(profile["id"]))
+
+
+# ==================== AUTH ====================
+
+def test_admin_login(public_session):
+    response = post_json(public_session, LOGIN_URL, LOGIN_BODY)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    assert "access_token" in data
+    assert data["admin"]["email"] == ADMIN_EMAIL
+
+
+def test_admin_login_invalid(public_session):
+    response = post_json(public_session, LOGIN_URL, INVALID_LOGIN_BODY)
+    assert response.status_code == 401
+
+
+# ==================== ADMIN PROFILES ====================
+
+def test_slug_generation(admin_session, created_profile):
+    profile_id, slug = created_profile
+    # rajesh-priya- (13) + 6 random chars
+    assert slug.startswith("rajesh-priya-")
+    assert len(slug) == 19
+
+
+def test_get_all_profiles(admin_session, created_profile):
+    profile_id, slug = created_profile
+    response = admin_session.get(PROFILES_URL)
+    response.raise_for_status()
+    assert profile_id in [profile["id"] for profile in orjson.loads(response.content)]
+
+
+def test_get_single_profile(admin_session, created_profile):
+    profile_id, slug = created_profile
+    response = admin_session.get(profile_url(profile_id))
+    response.raise_for_status()
+    assert orjson.loads(response.content)["invitation_link"] == f"/invite/{slug}"
+
+
+def test_invalid_whatsapp_rejected(admin_session):
+    # Missing + prefix
+    payload = build_profile_payload("Test Groom", "Test Bride", whatsapp_groom="9876543210")
+    response = post_json(admin_session, PROFILES_URL, orjson.dumps(payload))
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("design_id", DESIGN_IDS)
+def test_design_ids(admin_session, design_id):
+    payload = build_profile_payload(f"Test Groom {design_id}", f"Test Bride {design_id}", design_id=design_id)
+    response = post_json(admin_session, PROFILES_URL, orjson.dumps(payload))
+    response.raise_for_status()
+    profile = orjson.loads(response.content)
+    try:
+        assert profile["design_id"] == design_id
+    finally:
+        admin_session.delete(profile_url(profile["id"]))
+
+
+# ==================== MEDIA ====================
+
+def test_add_media(admin_session, created_profile):
+    profile_id, slug = created_profile
+    response = post_json(admin_session, f"{profile_url(profile_id)}/media", MEDIA_BODY)
+    response.raise_for_status()
+    media = orjson.loads(response.content)
+    assert media["profile_id"] == profile_id
+    assert media["media_type"] == "photo"
+
+
+@pytest.fixture(scope="session")
+def seeded_gallery(admin_session, created_profile):
+    """Seed MEDIA_SEED_COUNT photos onto created_profile concurrently, yields the responses"""
+    profile_id, slug = created_profile
+    media_url = f"{profile_url(profile_id)}/media"
+    with ThreadPoolExecutor(max_workers=MEDIA_SEED_WORKERS) as executor:
+        responses = list(executor.map(lambda body: post_json(admin_session, media_url, body), MEDIA_SEED_BODIES))
+    yield responses
+
+
+def test_add_media_batch(admin_session, created_profile, seeded_gallery):
+    profile_id, slug = created_profile
+    for response in seeded_gallery:
+        response.raise_for_status()
+
+    response = admin_session.get(f"{profile_url(profile_id)}/media")
+    response.raise_for_status()
+    captions = {media["caption"] for media in orjson.loads(response.content)}
+    assert all(f"Gallery photo {order}" in captions for order in range(MEDIA_SEED_COUNT))
+
+
+def test_get_profile_media(admin_session, created_profile):
+    profile_id, slug = created_profile
+    response = admin_session.get(f"{profile_url(profile_id)}/media")
+    response.raise_for_status()
+    assert isinstance(orjson.loads(response.content), list)
+
+
+# ==================== PUBLIC INVITATION & GREETINGS ====================
+
+def test_public_invitation(public_session, created_profile):
+    profile_id, slug = created_profile
+    response = public_session.get(invite_url(slug))
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    required_fields = [
+        "slug", "groom_name", "bride_name", "event_type", "event_date",
+        "venue", "design_id", "deity_id", "whatsapp_groom", "whatsapp_bride",
+        "enabled_languages", "media", "greetings"
+    ]
+    missing_fields = [field for field in required_fields if field not in data]
+    assert not missing_fields, f"Missing fields: {missing_fields}"
+    assert data["groom_name"] == "Rajesh Kumar"
+
+
+def test_large_response_gzipped(public_session, created_profile, seeded_gallery):
+    profile_id, slug = created_profile
+    response = public_session.get(invite_url(slug), headers={"Accept-Encoding": "gzip"})
+    response.raise_for_status()
+    # requests decodes the body transparently; the header shows what went over the wire
+    assert len(response.content) > 1000
+    assert response.headers.get("Content-Encoding") == "gzip"
+
+
+def test_small_response_not_gzipped(public_session):
+    response = public_session.post(
+        LOGIN_URL, data=LOGIN_BODY, headers={**JSON_HEADERS, "Accept-Encoding": "gzip"}
+    )
+    response.raise_for_status()
+    assert len(response.content) < 1000
+    assert "Content-Encoding" not in response.headers
+
+
+def test_public_invitation_invalid_slug(public_session):
+    response = public_session.get(INVALID_INVITE_URL)
+    assert response.status_code == 404
+
+
+def test_submit_greeting(public_session, created_profile):
+    profile_id, slug = created_profile
+    response = post_json(public_session, f"{invite_url(slug)}/greetings", GREETING_BODY)
+    response.raise_for_status()
+    assert orjson.loads(response.content)["guest_name"] == GREETING_PAYLOAD["guest_name"]
+
+    response = public_session.get(invite_url(slug))
+    response.raise_for_status()
+    greetings = orjson.loads(response.content)["greetings"]
+    assert any(g["guest_name"] == GREETING_PAYLOAD["guest_name"] for g in greetings)
+
+
+def test_submit_greeting_invalid_slug(public_session):
+    response = post_json(public_session, INVALID_GREETINGS_URL, GREETING_BODY)
+    assert response.status_code == 404
+
+
+def test_get_profile_greetings(admin_session, created_profile):
+    profile_id, slug = created_profile
+    response = admin_session.get(f"{profile_url(profile_id)}/greetings")
+    response.raise_for_status()
+    assert isinstance(orjson.loads(response.content), list)
+
+
+# ==================== PROFILE LIFECYCLE ====================
+
+@pytest.fixture(scope="class")
+def lifecycle_profile(admin_session, public_session):
+    """Profile for TestProfileLifecycle, with the ETag captured right after creation"""
+    payload = build_profile_payload("Amit Patel", "Neha Shah")
+    response = post_json(admin_session, PROFILES_URL, orjson.dumps(payload))
+    response.raise_for_status()
+    profile = orjson.loads(response.content)
+
+    response = public_session.get(invite_url(profile["slug"]))
+    response.raise_for_status()
+    profile["etag"] = response.headers.get("ETag")
+
+    yield profile
+    # Soft delete, so this also succeeds when a test already deleted the profile
+    admin_session.delete(profile_url(profile["id"]))
+
+
+@pytest.mark.xdist_group("profile_lifecycle")
+class TestProfileLifecycle:
+    """Create -> conditional GET -> update -> delete -> expired link on one class-scoped profile"""
+
+    def test_create_profile(self, lifecycle_profile):
+        assert lifecycle_profile["groom_name"] == "Amit Patel"
+        assert lifecycle_profile["bride_name"] == "Neha Shah"
+        slug = lifecycle_profile["slug"]
+        # amit-neha- (10) + 6 random chars
+        assert slug.startswith("amit-neha-")
+        assert len(slug) == 16
+        assert lifecycle_profile["invitation_link"] == f"/invite/{slug}"
+        assert lifecycle_profile["link_expiry_date"]
+
+    def test_public_invitation_etag(self, public_session, lifecycle_profile):
+        response = public_session.get(invite_url(lifecycle_profile["slug"]))
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        assert etag and etag.startswith("W/")
+
+        # Weak comparison: the tag with or without W/, and *, all revalidate
+        for if_none_match in (etag, etag[2:], "*"):
+            response = public_session.get(invite_url(lifecycle_profile["slug"]), headers={"If-None-Match": if_none_match})
+            assert response.status_code == 304
+            assert not response.content
+
+    def test_update_profile(self, admin_session, lifecycle_profile):
+        response = put_json(admin_session, profile_url(lifecycle_profile["id"]), UPDATE_BODY)
+        response.raise_for_status()
+        updated_profile = orjson.loads(response.content)
+        assert updated_profile["slug"] == lifecycle_profile["slug"]
+        assert updated_profile["venue"] == UPDATE_PAYLOAD["venue"]
+
+    def test_delete_profile(self, admin_session, lifecycle_profile):
+        response = admin_session.delete(profile_url(lifecycle_profile["id"]))
+        response.raise_for_status()
+
+    def test_expired_link_access(self, admin_session, public_session, lifecycle_profile):
+        # Deleting again is a no-op after test_delete_profile but lets this test run on its own
+        admin_session.delete(profile_url(lifecycle_profile["id"])).raise_for_status()
+
+        # A cached ETag must not mask expiry
+        response = public_session.get(
+            invite_url(lifecycle_profile["slug"]),
+            headers={"If-None-Match": lifecycle_profile["etag"]}
+        )
+        assert response.status_code == 410